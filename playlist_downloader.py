@@ -18,15 +18,29 @@ Example:
 import os
 import sys
 import json
+import asyncio
 import time
+import queue
 import shutil
+import hashlib
+import threading
+import subprocess
 import argparse
+import multiprocessing
 import logging
+import functools
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set
 from datetime import datetime
+import jinja2
 import yt_dlp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -39,43 +53,338 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters that are invalid in filenames on at least one operating system
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
+def _json_default(obj):
+    """Serialize sets (e.g. the file sets of the global index) as sorted lists."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, default=_json_default, indent=2 if indent else None,
+                      ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data):
+    """Deserialize JSON from bytes or str, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _UpdateLog:
+    """Append-only JSONL update log, flushed to disk every few records."""
+
+    def __init__(self, path: Path, flush_every: int):
+        """
+        Open an update log for appending.
+
+        Args:
+            path: Path of the log file
+            flush_every: Number of records buffered before the log is flushed
+        """
+        self._file = open(path, 'a', encoding='utf-8')
+        self._flush_every = flush_every
+        self._pending = 0
+
+    def append(self, key: str, record: Dict):
+        """Append a single keyed record to the log."""
+        self._file.write(_json_dumps({'id': key, **record}).decode('utf-8') + '\n')
+        self._pending += 1
+        if self._pending >= self._flush_every:
+            self.flush()
+
+    def flush(self):
+        """Flush buffered records to disk."""
+        self._file.flush()
+        self._pending = 0
+
+    def close(self):
+        """Flush buffered records and close the log."""
+        self._file.close()
+
+
+class _RateLimiter:
+    """Thread-safe token bucket limiting the rate of YouTube requests."""
+
+    def __init__(self, rate: float, per: float = 1.0):
+        """
+        Create a token bucket.
+
+        Args:
+            rate: Number of requests allowed per period (also the burst size)
+            per: Length of the period in seconds
+        """
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._fill_rate = rate / per
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be made."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._fill_rate
+            time.sleep(wait)
+
+
+# HTML index template, compiled once at import time
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }}</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        h1 {
+            color: #333;
+            border-bottom: 3px solid #cc0000;
+            padding-bottom: 10px;
+        }
+        .info {
+            background-color: #fff;
+            padding: 15px;
+            margin-bottom: 20px;
+            border-radius: 5px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .video-list {
+            list-style: none;
+            padding: 0;
+        }
+        .video-item {
+            background-color: #fff;
+            margin-bottom: 10px;
+            padding: 15px;
+            border-radius: 5px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            display: flex;
+            align-items: center;
+        }
+        .video-number {
+            font-weight: bold;
+            color: #cc0000;
+            margin-right: 15px;
+            min-width: 40px;
+        }
+        .video-link {
+            color: #1a73e8;
+            text-decoration: none;
+            flex-grow: 1;
+        }
+        .video-link:hover {
+            text-decoration: underline;
+        }
+        .status {
+            padding: 3px 8px;
+            border-radius: 3px;
+            font-size: 12px;
+            margin-left: 10px;
+        }
+        .downloaded {
+            background-color: #d4edda;
+            color: #155724;
+        }
+        .failed {
+            background-color: #f8d7da;
+            color: #721c24;
+        }
+    </style>
+</head>
+<body>
+    <h1>{{ title }}</h1>
+
+    <div class="info">
+        <p><strong>Total Videos:</strong> {{ videos|length }}</p>
+        <p><strong>Last Updated:</strong> {{ generated_at }}</p>
+    </div>
+
+    <ol class="video-list">
+{% for video in videos %}        <li class="video-item">
+            <span class="video-number">{{ video.playlist_index + 1 }}.</span>
+            <a href="https://www.youtube.com/watch?v={{ video.id }}" class="video-link" target="_blank">{{ video.title }}</a>
+            {% if video.status in ('downloaded', 'failed') %}<span class="status {{ video.status }}">{{ video.status|capitalize }}</span>{% endif %}
+        </li>
+{% endfor %}    </ol>
+</body>
+</html>
+"""
+
+_HTML_TMPL = jinja2.Template(_HTML_TEMPLATE, autoescape=True, keep_trailing_newline=True)
+
 
 class PlaylistDownloader:
     """Manages downloading and archiving YouTube playlists."""
 
     MAX_RETRIES = 3
+    DEFAULT_CONCURRENCY = 3
+    DEFAULT_PLAYLIST_CONCURRENCY = 1
+    MUX_QUEUE_SIZE = 4
+    METADATA_FLUSH_EVERY = 10
     METADATA_FILE = 'playlist_metadata.json'
+    METADATA_LOG_FILE = 'playlist_metadata.jsonl'
     GLOBAL_INDEX_FILE = 'global_video_index.json'
-
-    def __init__(self, channel_url: str, output_dir: str = './downloads'):
+    GLOBAL_INDEX_LOG_FILE = 'global_video_index.jsonl'
+    CACHE_DIR = '.cache'
+    DEFAULT_LISTING_TTL = 6 * 60 * 60
+    LISTING_CONCURRENCY = 4
+    API_RATE = 2.0
+    PROGRESSIVE_FORMAT = 'best[ext=mp4]/best'
+    COPY_BUFSIZE = 4 * 1024 * 1024
+
+    def __init__(self, channel_url: str, output_dir: str = './downloads',
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 listing_ttl: int = DEFAULT_LISTING_TTL,
+                 playlist_concurrency: int = DEFAULT_PLAYLIST_CONCURRENCY,
+                 api_rate: float = API_RATE):
         """
         Initialize the playlist downloader.
 
         Args:
             channel_url: YouTube channel URL or ID
             output_dir: Directory to save downloaded videos
+            concurrency: Maximum number of videos downloaded in parallel
+            listing_ttl: Seconds a cached playlist listing stays valid (0 disables the cache)
+            playlist_concurrency: Maximum number of playlists processed in parallel processes
+            api_rate: Maximum number of yt-dlp extraction calls per second
         """
         self.channel_url = channel_url
         self.output_dir = Path(output_dir)
+        self.concurrency = max(1, concurrency)
+        self.listing_ttl = listing_ttl
+        self.playlist_concurrency = max(1, playlist_concurrency)
+        self.api_rate = api_rate
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Extraction calls from all threads share one token bucket, so
+        # concurrent listings and downloads do not trigger HTTP 429 errors
+        self._api_limiter = _RateLimiter(api_rate)
+
+        # Playlist listings are cached on disk to avoid repeated API calls.
+        # Playlist heads (video count and first video ID) are compared with
+        # the metadata to skip listing playlists that did not change.
+        self._cache_dir = self.output_dir / self.CACHE_DIR
+        self._complete_listings: Set[str] = set()
+        self._playlist_heads: Dict[str, Optional[Dict]] = {}
+
         # Global index to track all downloaded videos and their locations
         self.global_index_path = self.output_dir / self.GLOBAL_INDEX_FILE
+        self.global_index_log_path = self.output_dir / self.GLOBAL_INDEX_LOG_FILE
+        self._global_index_log = None
         self.global_index = self._load_global_index()
 
+        # In a playlist worker process, global index updates are collected
+        # here and merged by the parent instead of being written to disk
+        self._global_index_delta: Optional[Dict[str, Dict]] = None
+
+        # Video and audio streams are merged by a separate worker thread so
+        # downloads can continue while ffmpeg is running. Each queued merge
+        # has a future, by video ID, that resolves to the merged file.
+        self._mux_queue: queue.Queue = queue.Queue(maxsize=self.MUX_QUEUE_SIZE)
+        self._mux_jobs: Dict[str, Future] = {}
+        self._mux_thread = threading.Thread(target=self._mux_worker, name='mux-worker', daemon=True)
+        self._mux_thread.start()
+
+        # yt-dlp instances are expensive to create (extractor registry, HTTP
+        # session), so they are created once per thread and reused: one for
+        # listings and one for downloads
+        self._ydl_local = threading.local()
+        self._ydl_instances: List[yt_dlp.YoutubeDL] = []
+
+        # Files copied into the current playlist directory, by video ID, and
+        # cached directory listings used to find files associated with a video
+        self._files_by_id: Dict[str, List[Path]] = {}
+        self._dir_listings: Dict[Path, List[str]] = {}
+
+        # IDs of the videos of the current playlist recorded as downloaded
+        self._done_ids: Set[str] = set()
+
+    @staticmethod
+    def _write_snapshot(path: Path, data: Dict):
+        """Atomically write a JSON snapshot to disk."""
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_bytes(_json_dumps(data, indent=True))
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _replay_log(log_path: Path, records: Dict):
+        """
+        Apply the records of a JSONL update log on top of a snapshot.
+
+        Args:
+            log_path: Path of the update log
+            records: Snapshot dictionary, updated in place
+        """
+        if not log_path.exists():
+            return
+
+        with open(log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = _json_loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partially written last line
+                    logger.warning(f"Ignoring truncated record in {log_path}")
+                    break
+                records[record.pop('id')] = record
+
     def _load_global_index(self) -> Dict:
         """Load the global video index from disk."""
+        global_index = {}
         if self.global_index_path.exists():
-            with open(self.global_index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+            global_index = _json_loads(self.global_index_path.read_bytes())
+        self._replay_log(self.global_index_log_path, global_index)
+
+        # File lists are kept as sets for O(1) membership checks
+        for entry in global_index.values():
+            entry['files'] = set(entry.get('files', ()))
+        return global_index
+
+    def _log_global_index(self, video_id: str):
+        """Append the current global index entry of a video to the update log."""
+        if self._global_index_delta is not None:
+            self._global_index_delta[video_id] = self.global_index[video_id]
+            return
+        if self._global_index_log is None:
+            self._global_index_log = _UpdateLog(self.global_index_log_path, self.METADATA_FLUSH_EVERY)
+        self._global_index_log.append(video_id, self.global_index[video_id])
 
     def _save_global_index(self):
-        """Save the global video index to disk."""
-        with open(self.global_index_path, 'w', encoding='utf-8') as f:
-            json.dump(self.global_index, f, indent=2, ensure_ascii=False)
-
-    def _sanitize_filename(self, filename: str) -> str:
+        """Compact the global video index: write the snapshot and truncate the update log."""
+        if self._global_index_delta is not None:
+            return
+        if self._global_index_log is not None:
+            self._global_index_log.close()
+            self._global_index_log = None
+        self._write_snapshot(self.global_index_path, self.global_index)
+        open(self.global_index_log_path, 'w').close()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _sanitize_filename(filename: str) -> str:
         """
         Sanitize a filename to be safe for all operating systems.
 
@@ -85,19 +394,120 @@ class PlaylistDownloader:
         Returns:
             Sanitized filename
         """
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        # Replace invalid characters, remove leading/trailing spaces and
+        # dots, and limit the length
+        return filename.translate(_SANITIZE_TABLE).strip('. ')[:200]
+
+    @staticmethod
+    def _dl_opts_template() -> Dict:
+        """Return the yt-dlp options used for downloading videos."""
+        return {
+            'format': '(bestvideo[ext=mp4],bestaudio[ext=m4a])/best[ext=mp4]/best',
+            'quiet': False,
+            'no_warnings': False,
+            'ignoreerrors': False,
+            'writesubtitles': True,
+            'writeautomaticsub': True,
+            'subtitleslangs': ['en'],
+            'writethumbnail': True,
+            # Keep the separate streams; they are merged by the mux worker
+            'keepvideo': True,
+            'postprocessors': [],
+        }
+
+    def _get_flat_ydl(self) -> yt_dlp.YoutubeDL:
+        """Get the listing (extract_flat) yt-dlp instance of the current thread."""
+        ydl = getattr(self._ydl_local, 'flat', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': True,
+                'lazy_playlist': True,
+            })
+            self._ydl_local.flat = ydl
+            self._ydl_instances.append(ydl)
+        return ydl
+
+    def _get_download_ydl(self, output_path: Path, progressive: bool = False) -> yt_dlp.YoutubeDL:
+        """
+        Get the download yt-dlp instance of the current thread.
+
+        Args:
+            output_path: Directory to save videos to
+            progressive: Get the instance downloading PROGRESSIVE_FORMAT (a
+                single file with both video and audio) instead of a stream pair
+
+        Returns:
+            yt-dlp instance writing to output_path
+        """
+        name = 'progressive' if progressive else 'download'
+        ydl = getattr(self._ydl_local, name, None)
+        if ydl is None:
+            opts = self._dl_opts_template()
+            if progressive:
+                opts['format'] = self.PROGRESSIVE_FORMAT
+            ydl = yt_dlp.YoutubeDL(opts)
+            setattr(self._ydl_local, name, ydl)
+            self._ydl_instances.append(ydl)
+        ydl.params['outtmpl']['default'] = str(output_path / '%(title)s.%(ext)s')
+        return ydl
+
+    def _extract_info(self, ydl: yt_dlp.YoutubeDL, url: str, **kwargs) -> Optional[Dict]:
+        """
+        Call ydl.extract_info once the rate limiter allows it.
+
+        Args:
+            ydl: yt-dlp instance
+            url: URL to extract
+            **kwargs: Keyword arguments for extract_info
 
-        # Remove leading/trailing spaces and dots
-        filename = filename.strip('. ')
+        Returns:
+            Extracted information dictionary
+        """
+        self._api_limiter.acquire()
+        return ydl.extract_info(url, **kwargs)
+
+    def close(self):
+        """Stop the mux worker and release the yt-dlp instances (HTTP sessions, cookie jars)."""
+        if self._mux_thread.is_alive():
+            # Merges queued before the sentinel are still completed
+            self._mux_queue.put(None)
+            self._mux_thread.join()
+        for ydl in self._ydl_instances:
+            ydl.close()
+        self._ydl_instances = []
+
+    def _listing_cache_path(self, url: str) -> Path:
+        """Return the path of the cached listing of a URL."""
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return self._cache_dir / f'{digest}.jsonl'
+
+    def _listing_cache_fresh(self, url: str) -> bool:
+        """Check whether a cached listing of a URL exists and is within the TTL."""
+        if self.listing_ttl <= 0:
+            return False
+        try:
+            mtime = self._listing_cache_path(url).stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - mtime < self.listing_ttl
 
-        # Limit length
-        if len(filename) > 200:
-            filename = filename[:200]
+    def _read_listing_cache(self, url: str) -> Iterator[Dict]:
+        """Iterate over the entries of the cached listing of a URL."""
+        with open(self._listing_cache_path(url), 'rb') as f:
+            for line in f:
+                yield _json_loads(line)
 
-        return filename
+    def _write_listing_cache(self, url: str, entries: List[Dict]):
+        """Atomically write the cached listing of a URL."""
+        if self.listing_ttl <= 0:
+            return
+        self._cache_dir.mkdir(exist_ok=True)
+        cache_path = self._listing_cache_path(url)
+        temp_path = cache_path.with_name(cache_path.name + '.tmp')
+        temp_path.write_bytes(b''.join(_json_dumps(entry) + b'\n' for entry in entries))
+        os.replace(temp_path, cache_path)
 
     def get_all_playlists(self) -> List[Dict]:
         """
@@ -106,102 +516,198 @@ class PlaylistDownloader:
         Returns:
             List of playlist information dictionaries
         """
-        logger.info(f"Fetching playlists from channel: {self.channel_url}")
+        if self._listing_cache_fresh(self.channel_url):
+            playlists = list(self._read_listing_cache(self.channel_url))
+            logger.info(f"Found {len(playlists)} playlists (cached)")
+            return playlists
 
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,
-        }
+        logger.info(f"Fetching playlists from channel: {self.channel_url}")
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Extract channel info
-                channel_info = ydl.extract_info(self.channel_url, download=False)
-
-                if not channel_info:
-                    logger.error("Could not fetch channel information")
-                    return []
+            ydl = self._get_flat_ydl()
+            # Extract channel info
+            channel_info = self._extract_info(ydl, self.channel_url, download=False)
+
+            if not channel_info:
+                logger.error("Could not fetch channel information")
+                return []
+
+            # Get playlists
+            playlists = []
+
+            # Try to get playlists from the channel
+            if 'entries' in channel_info:
+                for entry in channel_info['entries']:
+                    if entry.get('_type') == 'playlist':
+                        playlists.append({
+                            'id': entry.get('id'),
+                            'title': entry.get('title'),
+                            'url': entry.get('url') or f"https://www.youtube.com/playlist?list={entry.get('id')}"
+                        })
 
-                # Get playlists
-                playlists = []
+            # Alternative: Extract playlists from channel tabs
+            channel_id = channel_info.get('channel_id') or channel_info.get('id')
+            if channel_id and not playlists:
+                playlists_url = f"https://www.youtube.com/channel/{channel_id}/playlists"
+                playlists_info = self._extract_info(ydl, playlists_url, download=False)
 
-                # Try to get playlists from the channel
-                if 'entries' in channel_info:
-                    for entry in channel_info['entries']:
-                        if entry.get('_type') == 'playlist':
+                if playlists_info and 'entries' in playlists_info:
+                    for entry in playlists_info['entries']:
+                        if entry:
                             playlists.append({
                                 'id': entry.get('id'),
                                 'title': entry.get('title'),
                                 'url': entry.get('url') or f"https://www.youtube.com/playlist?list={entry.get('id')}"
                             })
 
-                # Alternative: Extract playlists from channel tabs
-                channel_id = channel_info.get('channel_id') or channel_info.get('id')
-                if channel_id and not playlists:
-                    playlists_url = f"https://www.youtube.com/channel/{channel_id}/playlists"
-                    playlists_info = ydl.extract_info(playlists_url, download=False)
-
-                    if playlists_info and 'entries' in playlists_info:
-                        for entry in playlists_info['entries']:
-                            if entry:
-                                playlists.append({
-                                    'id': entry.get('id'),
-                                    'title': entry.get('title'),
-                                    'url': entry.get('url') or f"https://www.youtube.com/playlist?list={entry.get('id')}"
-                                })
-
-                logger.info(f"Found {len(playlists)} playlists")
-                return playlists
+            logger.info(f"Found {len(playlists)} playlists")
+            if playlists:
+                self._write_listing_cache(self.channel_url, playlists)
+            return playlists
 
         except Exception as e:
             logger.error(f"Error fetching playlists: {e}")
             return []
 
-    def get_playlist_videos(self, playlist_url: str) -> List[Dict]:
+    def iter_playlist_videos(self, playlist_url: str) -> Iterator[Dict]:
         """
-        Get all videos from a playlist.
+        Iterate over the videos of a playlist as its pages are fetched.
+
+        The playlist is not resolved up front, so entries are yielded as
+        yt-dlp receives them instead of being collected in memory first.
+        A complete listing is also written to the listing cache, which is
+        used instead of YouTube while it is within the TTL.
 
         Args:
             playlist_url: URL of the playlist
 
-        Returns:
-            List of video information dictionaries
+        Yields:
+            Video information dictionaries
         """
-        logger.info(f"Fetching videos from playlist: {playlist_url}")
+        if self._listing_cache_fresh(playlist_url):
+            logger.info(f"Using cached video list for playlist: {playlist_url}")
+            self._complete_listings.add(playlist_url)
+            yield from self._read_listing_cache(playlist_url)
+            return
 
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,
-        }
+        logger.info(f"Fetching videos from playlist: {playlist_url}")
 
+        # Entries are streamed to a temporary cache file, which replaces the
+        # cached listing only if the whole playlist was fetched
+        cache_file = None
+        if self.listing_ttl > 0:
+            self._cache_dir.mkdir(exist_ok=True)
+            cache_path = self._listing_cache_path(playlist_url)
+            temp_path = cache_path.with_name(cache_path.name + '.tmp')
+            cache_file = open(temp_path, 'wb')
+
+        count = 0
+        complete = False
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                playlist_info = ydl.extract_info(playlist_url, download=False)
+            try:
+                ydl = self._get_flat_ydl()
+                playlist_info = self._extract_info(ydl, playlist_url, download=False, process=False)
 
                 if not playlist_info or 'entries' not in playlist_info:
                     logger.warning(f"No videos found in playlist")
-                    return []
+                    return
 
-                videos = []
                 for idx, entry in enumerate(playlist_info['entries']):
                     if entry:
-                        videos.append({
+                        count += 1
+                        video = {
                             'id': entry.get('id'),
                             'title': entry.get('title'),
                             'url': entry.get('url') or f"https://www.youtube.com/watch?v={entry.get('id')}",
-                            'playlist_index': idx
-                        })
+                            'playlist_index': idx,
+                            'ie_key': entry.get('ie_key')
+                        }
+                        if cache_file is not None:
+                            cache_file.write(_json_dumps(video) + b'\n')
+                        yield video
+                complete = True
+                self._complete_listings.add(playlist_url)
+
+            except Exception as e:
+                logger.error(f"Error fetching playlist videos: {e}")
 
-                logger.info(f"Found {len(videos)} videos in playlist")
-                return videos
+            logger.info(f"Found {count} videos in playlist")
+
+        finally:
+            if cache_file is not None:
+                cache_file.close()
+                if complete:
+                    os.replace(temp_path, cache_path)
+                else:
+                    os.remove(temp_path)
+
+    def _fetch_playlist_head(self, playlist_url: str) -> Optional[Dict]:
+        """
+        Fetch the video count and first video ID of a playlist.
+
+        Only the first page of the playlist is requested.
+
+        Args:
+            playlist_url: URL of the playlist
+
+        Returns:
+            Dictionary with 'last_count' and 'last_head_id', or None if unavailable
+        """
+        try:
+            ydl = self._get_flat_ydl()
+            playlist_info = self._extract_info(ydl, playlist_url, download=False, process=False)
+            if not playlist_info or playlist_info.get('playlist_count') is None:
+                return None
+
+            first_entry = next((entry for entry in playlist_info.get('entries') or [] if entry), None)
+            return {
+                'last_count': playlist_info['playlist_count'],
+                'last_head_id': first_entry.get('id') if first_entry else None,
+            }
 
         except Exception as e:
-            logger.error(f"Error fetching playlist videos: {e}")
-            return []
+            logger.warning(f"Error fetching playlist head: {e}")
+            return None
+
+    @staticmethod
+    def _playlist_is_unchanged(head: Optional[Dict], metadata: Dict) -> bool:
+        """
+        Check whether a playlist is unchanged and fully downloaded.
+
+        Args:
+            head: Playlist head from _fetch_playlist_head
+            metadata: Playlist metadata
+
+        Returns:
+            True if the playlist needs no further processing
+        """
+        if not head or 'last_count' not in metadata:
+            return False
+        if (head['last_count'], head['last_head_id']) != (metadata['last_count'], metadata.get('last_head_id')):
+            return False
+        return all(video.get('status') == 'downloaded' for video in metadata['videos'].values())
 
-    def download_video(self, video_url: str, output_path: Path, video_id: str) -> Optional[str]:
+    @staticmethod
+    def _remove_partial_stream(info: Dict) -> bool:
+        """
+        Remove the file of a download that lacks either video or audio.
+
+        Args:
+            info: Information dictionary returned by yt-dlp for the download
+
+        Returns:
+            True if a single video-only or audio-only stream was downloaded
+        """
+        downloads = info.get('requested_downloads') or []
+        if len(downloads) != 1 or 'none' not in (downloads[0].get('vcodec'), downloads[0].get('acodec')):
+            return False
+        filepath = downloads[0].get('filepath')
+        if filepath and os.path.exists(filepath):
+            os.remove(filepath)
+        return True
+
+    def download_video(self, video_url: str, output_path: Path, video_id: str,
+                       ie_key: Optional[str] = None) -> Optional[str]:
         """
         Download a single video with retry logic.
 
@@ -209,46 +715,59 @@ class PlaylistDownloader:
             video_url: URL of the video
             output_path: Directory to save the video
             video_id: YouTube video ID
+            ie_key: yt-dlp extractor of the video, as reported by the listing
 
         Returns:
-            Path to downloaded file if successful, None otherwise
+            Path to downloaded file if successful, None otherwise. When the
+            streams still have to be merged, the merge is tracked in
+            ``self._mux_jobs`` and the file exists once it completes.
         """
-        ydl_opts = {
-            'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-            'outtmpl': str(output_path / '%(title)s.%(ext)s'),
-            'quiet': False,
-            'no_warnings': False,
-            'ignoreerrors': False,
-            'writesubtitles': True,
-            'writeautomaticsub': True,
-            'subtitleslangs': ['en'],
-            'writethumbnail': True,
-            'merge_output_format': 'mp4',
-        }
-
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
                 logger.info(f"Downloading video {video_id} (attempt {attempt}/{self.MAX_RETRIES})")
 
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(video_url, download=True)
-
-                    if info:
-                        # Get the actual filename that was created
-                        filename = ydl.prepare_filename(info)
-
-                        # Check if file exists
-                        if os.path.exists(filename):
-                            logger.info(f"Successfully downloaded: {filename}")
-                            return filename
-
-                        # Sometimes the extension changes, try to find the file
-                        base_name = os.path.splitext(filename)[0]
-                        for ext in ['.mp4', '.webm', '.mkv']:
-                            potential_file = base_name + ext
-                            if os.path.exists(potential_file):
-                                logger.info(f"Successfully downloaded: {potential_file}")
-                                return potential_file
+                ydl = self._get_download_ydl(output_path)
+                info = self._extract_info(ydl, video_url, download=True, ie_key=ie_key)
+
+                # Without both an MP4 video and an M4A audio stream, the pair
+                # selector picks only one of them; a progressive format is
+                # downloaded instead
+                if info and self._remove_partial_stream(info):
+                    logger.info(f"No MP4/M4A stream pair for {video_id}, downloading a progressive format")
+                    ydl = self._get_download_ydl(output_path, progressive=True)
+                    info = self._extract_info(ydl, video_url, download=True, ie_key=ie_key)
+                    if info and self._remove_partial_stream(info):
+                        logger.error(f"No format with both video and audio for video {video_id}")
+                        return None
+
+                if info:
+                    # Separate video and audio streams are queued for merging
+                    downloads = info.get('requested_downloads') or []
+                    if len(downloads) == 2:
+                        downloads.sort(key=lambda d: d.get('vcodec') == 'none')
+                        video_file, audio_file = (d['filepath'] for d in downloads)
+                        out_path = os.path.splitext(video_file)[0] + '.mp4'
+                        merge = Future()
+                        self._mux_jobs[video_id] = merge
+                        self._mux_queue.put((video_file, audio_file, out_path, video_id, merge))
+                        logger.info(f"Downloaded streams for {video_id}, queued for merging")
+                        return out_path
+
+                    # Get the actual filename that was created
+                    filename = ydl.prepare_filename(info)
+
+                    # Check if file exists
+                    if os.path.exists(filename):
+                        logger.info(f"Successfully downloaded: {filename}")
+                        return filename
+
+                    # Sometimes the extension changes, try to find the file
+                    base_name = os.path.splitext(filename)[0]
+                    for ext in ['.mp4', '.webm', '.mkv']:
+                        potential_file = base_name + ext
+                        if os.path.exists(potential_file):
+                            logger.info(f"Successfully downloaded: {potential_file}")
+                            return potential_file
 
             except Exception as e:
                 logger.warning(f"Attempt {attempt} failed for video {video_id}: {e}")
@@ -262,7 +781,129 @@ class PlaylistDownloader:
 
         return None
 
-    def copy_video_from_another_playlist(self, video_id: str, target_dir: Path) -> bool:
+    def _mux_worker(self):
+        """Merge queued video/audio stream pairs with ffmpeg, one at a time."""
+        while True:
+            job = self._mux_queue.get()
+            if job is None:
+                # Sentinel sent by close()
+                self._mux_queue.task_done()
+                return
+            video_file, audio_file, out_path, video_id, merge = job
+            # The streams are merged even if nobody waits for the result
+            # anymore (the playlist was interrupted)
+            waited = merge.set_running_or_notify_cancel()
+            try:
+                self._mux_streams(video_file, audio_file, out_path)
+                logger.info(f"Successfully downloaded: {out_path}")
+                if waited:
+                    merge.set_result(out_path)
+            except Exception as e:
+                logger.error(f"Error merging streams for video {video_id}: {e}")
+                if waited:
+                    merge.set_exception(e)
+            finally:
+                self._mux_queue.task_done()
+
+    def _mux_streams(self, video_file: str, audio_file: str, out_path: str):
+        """
+        Merge a video and an audio stream into a single MP4 file.
+
+        Args:
+            video_file: Path to the video-only stream
+            audio_file: Path to the audio-only stream
+            out_path: Path of the merged file (may be the same as video_file)
+        """
+        temp_path = os.path.splitext(out_path)[0] + '.temp.mp4'
+        cmd = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-i', video_file, '-i', audio_file,
+            '-map', '0:v:0', '-map', '1:a:0', '-c', 'copy',
+            temp_path,
+        ]
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise RuntimeError(stderr.decode('utf-8', errors='replace').strip())
+
+        os.replace(temp_path, out_path)
+
+        # Remove the separate streams now that they are merged
+        for stream_file in (video_file, audio_file):
+            if stream_file != out_path and os.path.exists(stream_file):
+                os.remove(stream_file)
+
+    def _list_dir(self, directory: Path) -> List[str]:
+        """
+        List the file names in a directory, scanning it only once.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Names of the files in the directory
+        """
+        names = self._dir_listings.get(directory)
+        if names is None:
+            with os.scandir(directory) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+            self._dir_listings[directory] = names
+        return names
+
+    @classmethod
+    def _dedup_copy(cls, src: Path, dst: Path):
+        """
+        Copy a file, hardlinking it when possible.
+
+        Falls back to an in-kernel copy with os.copy_file_range (which
+        reflinks on filesystems such as Btrfs and XFS) or os.sendfile, and
+        finally to a buffered copy with COPY_BUFSIZE chunks.
+
+        Args:
+            src: Source file
+            dst: Destination file (replaced if it exists)
+        """
+        if dst.exists():
+            if os.path.samefile(src, dst):
+                return
+            dst.unlink()
+
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            # Cross-device link, or links not supported/permitted
+            pass
+
+        for kernel_copy in ('copy_file_range', 'sendfile'):
+            if not hasattr(os, kernel_copy):
+                continue
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                    size = os.fstat(in_fd).st_size
+                    offset = 0
+                    while offset < size:
+                        if kernel_copy == 'copy_file_range':
+                            copied = os.copy_file_range(in_fd, out_fd, size - offset)
+                        else:
+                            copied = os.sendfile(out_fd, in_fd, offset, size - offset)
+                        if copied == 0:
+                            raise OSError(f"{kernel_copy} stopped at {offset}/{size} bytes")
+                        offset += copied
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                # Not supported for these files (e.g. sendfile outside Linux)
+                pass
+
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, cls.COPY_BUFSIZE)
+        shutil.copystat(src, dst)
+
+    def copy_video_from_another_playlist(self, video_id: str, target_dir: Path) -> Optional[str]:
         """
         Copy a video from another playlist if it exists.
 
@@ -271,42 +912,43 @@ class PlaylistDownloader:
             target_dir: Target directory to copy to
 
         Returns:
-            True if copied successfully, False otherwise
+            Path of the source file if copied successfully, None otherwise
         """
         if video_id not in self.global_index:
-            return False
+            return None
 
-        source_files = self.global_index[video_id].get('files', [])
+        # Snapshot the set; it may be updated from the event loop thread
+        source_files = tuple(self.global_index[video_id].get('files', ()))
         if not source_files:
-            return False
+            return None
 
         # Get the first available source
-        source_file = source_files[0]
-        source_path = Path(source_file)
+        source_path = next((Path(f) for f in source_files if os.path.exists(f)), None)
 
-        if not source_path.exists():
-            logger.warning(f"Source file not found: {source_path}")
-            return False
+        if source_path is None:
+            logger.warning(f"Source file not found: {source_files[0]}")
+            return None
 
         # Copy the file
         target_path = target_dir / source_path.name
 
         try:
-            shutil.copy2(source_path, target_path)
+            self._dedup_copy(source_path, target_path)
             logger.info(f"Copied video from {source_path} to {target_path}")
+            self._files_by_id.setdefault(video_id, []).append(target_path)
 
             # Also copy associated files (subtitles, thumbnails)
-            base_name = source_path.stem
-            for file in source_path.parent.glob(f"{base_name}.*"):
-                if file.suffix not in ['.mp4', '.webm', '.mkv']:
-                    target_file = target_dir / file.name
-                    shutil.copy2(file, target_file)
+            prefix = source_path.stem + '.'
+            for name in self._list_dir(source_path.parent):
+                if name.startswith(prefix) and os.path.splitext(name)[1] not in ['.mp4', '.webm', '.mkv']:
+                    self._dedup_copy(source_path.parent / name, target_dir / name)
 
-            return True
+            self._dir_listings.pop(target_dir, None)
+            return str(source_path)
 
         except Exception as e:
             logger.error(f"Error copying video: {e}")
-            return False
+            return None
 
     def generate_html_index(self, playlist_dir: Path, playlist_title: str, videos: List[Dict]):
         """
@@ -317,223 +959,292 @@ class PlaylistDownloader:
             playlist_title: Title of the playlist
             videos: List of video information dictionaries
         """
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{playlist_title}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        h1 {{
-            color: #333;
-            border-bottom: 3px solid #cc0000;
-            padding-bottom: 10px;
-        }}
-        .info {{
-            background-color: #fff;
-            padding: 15px;
-            margin-bottom: 20px;
-            border-radius: 5px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .video-list {{
-            list-style: none;
-            padding: 0;
-        }}
-        .video-item {{
-            background-color: #fff;
-            margin-bottom: 10px;
-            padding: 15px;
-            border-radius: 5px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            display: flex;
-            align-items: center;
-        }}
-        .video-number {{
-            font-weight: bold;
-            color: #cc0000;
-            margin-right: 15px;
-            min-width: 40px;
-        }}
-        .video-link {{
-            color: #1a73e8;
-            text-decoration: none;
-            flex-grow: 1;
-        }}
-        .video-link:hover {{
-            text-decoration: underline;
-        }}
-        .status {{
-            padding: 3px 8px;
-            border-radius: 3px;
-            font-size: 12px;
-            margin-left: 10px;
-        }}
-        .downloaded {{
-            background-color: #d4edda;
-            color: #155724;
-        }}
-        .failed {{
-            background-color: #f8d7da;
-            color: #721c24;
-        }}
-    </style>
-</head>
-<body>
-    <h1>{playlist_title}</h1>
-
-    <div class="info">
-        <p><strong>Total Videos:</strong> {len(videos)}</p>
-        <p><strong>Last Updated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    </div>
-
-    <ol class="video-list">
-"""
-
-        for video in videos:
-            video_id = video['id']
-            title = video['title']
-            status = video.get('status', 'unknown')
-
-            status_class = 'downloaded' if status == 'downloaded' else 'failed' if status == 'failed' else ''
-            status_text = status.capitalize() if status_class else ''
-
-            html_content += f"""        <li class="video-item">
-            <span class="video-number">{video['playlist_index'] + 1}.</span>
-            <a href="https://www.youtube.com/watch?v={video_id}" class="video-link" target="_blank">{title}</a>
-            {f'<span class="status {status_class}">{status_text}</span>' if status_text else ''}
-        </li>
-"""
-
-        html_content += """    </ol>
-</body>
-</html>
-"""
-
         index_path = playlist_dir / 'index.html'
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        index_path.write_text(_HTML_TMPL.render(
+            title=playlist_title,
+            videos=videos,
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ), encoding='utf-8')
 
         logger.info(f"Generated HTML index: {index_path}")
 
-    def process_playlist(self, playlist: Dict):
+    def _playlist_dir(self, playlist: Dict) -> Path:
+        """Return the directory of a playlist."""
+        return self.output_dir / self._sanitize_filename(playlist['title'])
+
+    def _load_metadata(self, playlist_dir: Path, playlist: Dict) -> Dict:
         """
-        Process a single playlist: download videos and generate HTML index.
+        Load playlist metadata from its snapshot and update log.
 
         Args:
+            playlist_dir: Directory of the playlist
             playlist: Playlist information dictionary
-        """
-        playlist_id = playlist['id']
-        playlist_title = playlist['title']
-        playlist_url = playlist['url']
-
-        logger.info(f"Processing playlist: {playlist_title}")
-
-        # Create playlist directory
-        safe_title = self._sanitize_filename(playlist_title)
-        playlist_dir = self.output_dir / safe_title
-        playlist_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load or create playlist metadata
+        Returns:
+            Playlist metadata dictionary
+        """
         metadata_path = playlist_dir / self.METADATA_FILE
         if metadata_path.exists():
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata = _json_loads(metadata_path.read_bytes())
         else:
             metadata = {
-                'playlist_id': playlist_id,
-                'playlist_title': playlist_title,
-                'playlist_url': playlist_url,
+                'playlist_id': playlist['id'],
+                'playlist_title': playlist['title'],
+                'playlist_url': playlist['url'],
                 'videos': {}
             }
+        self._replay_log(playlist_dir / self.METADATA_LOG_FILE, metadata['videos'])
+        return metadata
 
-        # Get all videos in the playlist
-        videos = self.get_playlist_videos(playlist_url)
+    @staticmethod
+    def _load_done_ids(metadata: Dict) -> Set[str]:
+        """
+        Collect the IDs of the videos whose latest status is 'downloaded'.
 
-        # Process each video
-        for video in videos:
-            video_id = video['id']
-            video_title = video['title']
-            video_url = video['url']
+        Args:
+            metadata: Playlist metadata, with its update log replayed
 
-            # Check if video is already downloaded
-            if video_id in metadata['videos']:
-                existing_status = metadata['videos'][video_id].get('status')
-                if existing_status == 'downloaded':
-                    logger.info(f"Video {video_id} already downloaded, skipping")
-                    video['status'] = 'downloaded'
-                    continue
+        Returns:
+            Set of downloaded video IDs
+        """
+        return {video_id for video_id, record in metadata['videos'].items()
+                if record.get('status') == 'downloaded'}
+
+    def _save_metadata(self, playlist_dir: Path, metadata: Dict):
+        """Compact playlist metadata: write the snapshot and truncate the update log."""
+        self._write_snapshot(playlist_dir / self.METADATA_FILE, metadata)
+        open(playlist_dir / self.METADATA_LOG_FILE, 'w').close()
 
-            # Check if video exists in another playlist
-            if video_id in self.global_index:
-                logger.info(f"Video {video_id} found in another playlist, copying...")
-                if self.copy_video_from_another_playlist(video_id, playlist_dir):
+    async def _process_video(self, video: Dict, playlist_dir: Path, metadata: Dict,
+                             metadata_log: _UpdateLog, lock: asyncio.Lock) -> Optional[asyncio.Future]:
+        """
+        Copy or download a single playlist video and record the result.
+
+        Args:
+            video: Video information dictionary (updated with its status)
+            playlist_dir: Directory of the playlist being processed
+            metadata: Playlist metadata, shared by all videos of the playlist
+            metadata_log: Open update log of the playlist metadata
+            lock: Lock serializing metadata/global index updates and writes
+
+        Returns:
+            The pending merge of the downloaded streams, if any. The video is
+            not recorded until it completes; see _record_download.
+        """
+        video_id = video['id']
+        video_title = video['title']
+        video_url = video['url']
+
+        # Check if video is already downloaded
+        if video_id in self._done_ids:
+            logger.info(f"Video {video_id} already downloaded, skipping")
+            video['status'] = 'downloaded'
+            return None
+
+        # Check if video exists in another playlist
+        if video_id in self.global_index:
+            logger.info(f"Video {video_id} found in another playlist, copying...")
+            copied_from = await asyncio.to_thread(self.copy_video_from_another_playlist, video_id, playlist_dir)
+            if copied_from:
+                async with lock:
                     # Update metadata
                     metadata['videos'][video_id] = {
                         'title': video_title,
                         'url': video_url,
                         'status': 'downloaded',
                         'downloaded_at': datetime.now().isoformat(),
-                        'copied_from': self.global_index[video_id]['files'][0]
+                        'copied_from': copied_from
                     }
                     video['status'] = 'downloaded'
+                    self._done_ids.add(video_id)
 
                     # Update global index
-                    video_files = list(playlist_dir.glob(f"*{video_id}*"))
+                    video_files = self._files_by_id.get(video_id, [])
                     if video_files:
                         file_path = str(video_files[0])
                         if file_path not in self.global_index[video_id]['files']:
-                            self.global_index[video_id]['files'].append(file_path)
+                            self.global_index[video_id]['files'].add(file_path)
+                            self._log_global_index(video_id)
 
-                    # Save metadata
-                    with open(metadata_path, 'w', encoding='utf-8') as f:
-                        json.dump(metadata, f, indent=2, ensure_ascii=False)
-                    self._save_global_index()
+                    # Record the update
+                    metadata_log.append(video_id, metadata['videos'][video_id])
 
-                    continue
+                return None
 
-            # Download the video
-            downloaded_file = self.download_video(video_url, playlist_dir, video_id)
+        # Download the video
+        downloaded_file = await asyncio.to_thread(self.download_video, video_url, playlist_dir, video_id,
+                                                  video.get('ie_key'))
 
-            if downloaded_file:
-                # Update metadata
-                metadata['videos'][video_id] = {
-                    'title': video_title,
-                    'url': video_url,
-                    'status': 'downloaded',
-                    'downloaded_at': datetime.now().isoformat(),
-                    'file': downloaded_file
-                }
-                video['status'] = 'downloaded'
+        # Separate streams are still being merged; the video is recorded by
+        # the caller once the merged file exists
+        merge = self._mux_jobs.pop(video_id, None)
+        if merge is not None:
+            return asyncio.wrap_future(merge)
 
-                # Update global index
-                if video_id not in self.global_index:
-                    self.global_index[video_id] = {
-                        'title': video_title,
-                        'files': []
-                    }
-                self.global_index[video_id]['files'].append(downloaded_file)
+        async with lock:
+            self._record_download(video, downloaded_file, metadata, metadata_log)
+        return None
+
+    def _record_download(self, video: Dict, downloaded_file: Optional[str], metadata: Dict,
+                         metadata_log: _UpdateLog):
+        """
+        Record the result of a video download in the metadata and global index.
+
+        Must be called with the playlist lock held.
+
+        Args:
+            video: Video information dictionary (updated with its status)
+            downloaded_file: Path of the downloaded file, None if it failed
+            metadata: Playlist metadata, shared by all videos of the playlist
+            metadata_log: Open update log of the playlist metadata
+        """
+        video_id = video['id']
+        video_title = video['title']
+        video_url = video['url']
+        now = datetime.now().isoformat()
+        if downloaded_file:
+            # Update metadata
+            metadata['videos'][video_id] = {
+                'title': video_title,
+                'url': video_url,
+                'status': 'downloaded',
+                'downloaded_at': now,
+                'file': downloaded_file
+            }
+            video['status'] = 'downloaded'
+            self._done_ids.add(video_id)
 
-            else:
-                # Mark as failed
-                metadata['videos'][video_id] = {
+            # Update global index
+            if video_id not in self.global_index:
+                self.global_index[video_id] = {
                     'title': video_title,
-                    'url': video_url,
-                    'status': 'failed',
-                    'failed_at': datetime.now().isoformat()
+                    'files': set()
                 }
-                video['status'] = 'failed'
+            self.global_index[video_id]['files'].add(downloaded_file)
+            self._log_global_index(video_id)
 
-            # Save metadata after each video
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+        else:
+            # Mark as failed
+            metadata['videos'][video_id] = {
+                'title': video_title,
+                'url': video_url,
+                'status': 'failed',
+                'failed_at': now
+            }
+            video['status'] = 'failed'
+
+        # Record the update after each video
+        metadata_log.append(video_id, metadata['videos'][video_id])
+
+    async def process_playlist_async(self, playlist: Dict):
+        """
+        Process a single playlist: download videos and generate HTML index.
+
+        Up to ``self.concurrency`` videos are copied or downloaded at once.
+
+        Args:
+            playlist: Playlist information dictionary
+        """
+        playlist_title = playlist['title']
+        playlist_url = playlist['url']
+
+        logger.info(f"Processing playlist: {playlist_title}")
+
+        # Create playlist directory
+        playlist_dir = self._playlist_dir(playlist)
+        playlist_dir.mkdir(parents=True, exist_ok=True)
+
+        # Load or create playlist metadata
+        metadata = self._load_metadata(playlist_dir, playlist)
+        self._done_ids = self._load_done_ids(metadata)
+        self._files_by_id = {}
+
+        # Skip playlists that did not change since they were fully downloaded.
+        # A fresh cached listing costs no request, so it is used as is.
+        if playlist_url in self._playlist_heads:
+            head = self._playlist_heads.pop(playlist_url)
+        elif not self._listing_cache_fresh(playlist_url):
+            head = await asyncio.to_thread(self._fetch_playlist_head, playlist_url)
+        else:
+            head = None
+        if self._playlist_is_unchanged(head, metadata):
+            logger.info(f"Playlist unchanged and fully downloaded, skipping: {playlist_title}")
+            return
+
+        # Updates are appended to a log, flushed every METADATA_FLUSH_EVERY
+        # videos, and compacted into the snapshot once the playlist is done,
+        # instead of rewriting the snapshot per video
+        metadata_log = _UpdateLog(playlist_dir / self.METADATA_LOG_FILE, self.METADATA_FLUSH_EVERY)
+        try:
+            # Process videos concurrently as the playlist is listed, bounded
+            # to avoid YouTube rate limits. Only the slim video dictionaries
+            # are kept for the HTML index; finished tasks are dropped.
+            semaphore = asyncio.Semaphore(self.concurrency)
+            lock = asyncio.Lock()
+            videos = []
+            pending: Set[asyncio.Task] = set()
+            errors = []
+            # Latest unfinished task by video ID, so that a video listed more
+            # than once is not downloaded concurrently into the same file
+            in_flight: Dict[str, asyncio.Task] = {}
+
+            async def _bounded(video: Dict, previous: Optional[asyncio.Task]):
+                if previous is not None:
+                    # Run after the earlier entry, then it is found downloaded
+                    await asyncio.wait({previous})
+                    await semaphore.acquire()
+                try:
+                    merge = await self._process_video(video, playlist_dir, metadata, metadata_log, lock)
+                finally:
+                    semaphore.release()
+
+                # The download slot is free while ffmpeg merges the streams.
+                # Videos that could not be merged are marked as failed so they
+                # are retried on the next run.
+                if merge is not None:
+                    try:
+                        downloaded_file = await merge
+                    except Exception:
+                        downloaded_file = None
+                    async with lock:
+                        self._record_download(video, downloaded_file, metadata, metadata_log)
+
+            def _done(video_id: str, task: asyncio.Task):
+                pending.discard(task)
+                if in_flight.get(video_id) is task:
+                    del in_flight[video_id]
+                if not task.cancelled() and task.exception() is not None:
+                    errors.append(task.exception())
+
+            entries = self.iter_playlist_videos(playlist_url)
+            while True:
+                # Fetching the next entry may load another playlist page
+                video = await asyncio.to_thread(next, entries, None)
+                if video is None:
+                    break
+                videos.append(video)
+
+                previous = in_flight.get(video['id'])
+                if previous is None:
+                    await semaphore.acquire()
+                task = asyncio.create_task(_bounded(video, previous))
+                in_flight[video['id']] = task
+                pending.add(task)
+                task.add_done_callback(functools.partial(_done, video['id']))
+
+            # Tasks finish once their merge, if any, has been recorded
+            await asyncio.gather(*pending, return_exceptions=True)
+            if errors:
+                raise errors[0]
+
+            # Remember the playlist head once the whole playlist was listed
+            if head and playlist_url in self._complete_listings:
+                metadata.update(head)
+
+        finally:
+            self._dir_listings.pop(playlist_dir, None)
+            metadata_log.close()
+            self._save_metadata(playlist_dir, metadata)
             self._save_global_index()
 
         # Generate HTML index
@@ -541,28 +1252,180 @@ class PlaylistDownloader:
 
         logger.info(f"Finished processing playlist: {playlist_title}")
 
-    def run(self):
-        """Run the playlist downloader for all playlists in the channel."""
+    def process_playlist(self, playlist: Dict):
+        """
+        Process a single playlist synchronously.
+
+        Args:
+            playlist: Playlist information dictionary
+        """
+        asyncio.run(self.process_playlist_async(playlist))
+
+    async def _prefetch_listings(self, playlists: List[Dict]):
+        """
+        Fetch the video listings of several playlists concurrently.
+
+        Listings are written to the listing cache, from which the playlists
+        are then read while they are processed one by one. Playlists whose
+        head shows they are unchanged and fully downloaded are not listed.
+
+        Args:
+            playlists: Playlist information dictionaries
+        """
+        if self.listing_ttl <= 0:
+            return
+
+        stale = [playlist for playlist in playlists if not self._listing_cache_fresh(playlist['url'])]
+        if len(stale) < 2:
+            return
+
+        logger.info(f"Prefetching video lists of {len(stale)} playlists")
+        semaphore = asyncio.Semaphore(self.LISTING_CONCURRENCY)
+
+        def _fetch(playlist: Dict):
+            playlist_url = playlist['url']
+            head = self._fetch_playlist_head(playlist_url)
+            try:
+                metadata = self._load_metadata(self._playlist_dir(playlist), playlist)
+            except Exception as e:
+                # The head is not kept, so the playlist is handled (or fails)
+                # on its own when it is processed
+                logger.warning(f"Error loading metadata of playlist {playlist.get('title', 'Unknown')}: {e}")
+                return
+            self._playlist_heads[playlist_url] = head
+            if self._playlist_is_unchanged(head, metadata):
+                return
+            for _ in self.iter_playlist_videos(playlist_url):
+                pass
+
+        async def _bounded(playlist: Dict):
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(_fetch, playlist)
+                except Exception as e:
+                    # Not fatal: the playlist is listed again when processed
+                    logger.warning(f"Error prefetching playlist {playlist.get('title', 'Unknown')}: {e}")
+
+        await asyncio.gather(*(_bounded(playlist) for playlist in stale))
+
+    def _merge_global_index(self, delta: Dict[str, Dict]):
+        """
+        Merge global index updates collected by a playlist worker process.
+
+        Args:
+            delta: Updated global index entries, by video ID
+        """
+        for video_id, entry in delta.items():
+            current = self.global_index.setdefault(video_id, {'title': entry['title'], 'files': set()})
+            current['files'] |= entry['files']
+            self._log_global_index(video_id)
+
+    async def _process_playlists_in_pool(self, playlists: List[Dict]):
+        """
+        Process playlists in parallel worker processes.
+
+        Each worker has its own yt-dlp instances and mux worker and processes
+        one playlist at a time. Workers only read the global index; their
+        updates are returned and merged here to avoid concurrent writes.
+
+        Args:
+            playlists: Playlist information dictionaries
+        """
+        loop = asyncio.get_running_loop()
+        max_workers = min(self.playlist_concurrency, len(playlists))
+        # The request rate budget is shared between the workers
+        options = {
+            'concurrency': self.concurrency,
+            'listing_ttl': self.listing_ttl,
+            'api_rate': self.api_rate / max_workers,
+        }
+
+        # Spawn rather than fork: this process already runs threads
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+
+            async def _submit(idx: int, playlist: Dict):
+                logger.info(f"Processing playlist {idx}/{len(playlists)}")
+                heads = {}
+                if playlist['url'] in self._playlist_heads:
+                    heads[playlist['url']] = self._playlist_heads.pop(playlist['url'])
+                try:
+                    delta = await loop.run_in_executor(
+                        executor, _process_playlist_worker,
+                        self.channel_url, str(self.output_dir), playlist, options, heads
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing playlist {playlist.get('title', 'Unknown')}: {e}")
+                    return
+                self._merge_global_index(delta)
+
+            await asyncio.gather(*(_submit(idx, playlist) for idx, playlist in enumerate(playlists, 1)))
+
+        self._save_global_index()
+
+    async def _run_async(self):
+        """Process all playlists in the channel inside a single event loop."""
         logger.info("Starting YouTube Playlist Archiver")
 
         # Get all playlists
-        playlists = self.get_all_playlists()
+        playlists = await asyncio.to_thread(self.get_all_playlists)
 
         if not playlists:
             logger.error("No playlists found. Exiting.")
             return
 
+        await self._prefetch_listings(playlists)
+
+        if self.playlist_concurrency > 1 and len(playlists) > 1:
+            await self._process_playlists_in_pool(playlists)
+            logger.info("Finished processing all playlists")
+            return
+
         # Process each playlist
         for idx, playlist in enumerate(playlists, 1):
             logger.info(f"Processing playlist {idx}/{len(playlists)}")
             try:
-                self.process_playlist(playlist)
+                await self.process_playlist_async(playlist)
             except Exception as e:
                 logger.error(f"Error processing playlist {playlist.get('title', 'Unknown')}: {e}")
                 continue
 
         logger.info("Finished processing all playlists")
 
+    def run(self):
+        """Run the playlist downloader for all playlists in the channel."""
+        try:
+            asyncio.run(self._run_async())
+        finally:
+            self.close()
+
+
+def _process_playlist_worker(channel_url: str, output_dir: str, playlist: Dict,
+                             options: Dict, heads: Dict[str, Optional[Dict]]) -> Dict[str, Dict]:
+    """
+    Process a single playlist in a worker process.
+
+    Args:
+        channel_url: YouTube channel URL or ID
+        output_dir: Directory to save downloaded videos
+        playlist: Playlist information dictionary
+        options: Keyword arguments for PlaylistDownloader
+        heads: Playlist heads already fetched by the parent, by playlist URL
+
+    Returns:
+        Global index entries updated by the worker, by video ID
+    """
+    downloader = PlaylistDownloader(channel_url, output_dir, **options)
+    downloader._global_index_delta = {}
+    downloader._playlist_heads.update(heads)
+    try:
+        downloader.process_playlist(playlist)
+    except Exception as e:
+        logger.error(f"Error processing playlist {playlist.get('title', 'Unknown')}: {e}")
+    finally:
+        downloader.close()
+    return downloader._global_index_delta
+
 
 def main():
     """Main entry point for the script."""
@@ -589,10 +1452,37 @@ Examples:
         help='Output directory for downloaded videos (default: ./downloads)'
     )
 
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=PlaylistDownloader.DEFAULT_CONCURRENCY,
+        help='Number of videos to download in parallel '
+             f'(default: {PlaylistDownloader.DEFAULT_CONCURRENCY})'
+    )
+
+    parser.add_argument(
+        '--playlist-concurrency',
+        type=int,
+        default=PlaylistDownloader.DEFAULT_PLAYLIST_CONCURRENCY,
+        help='Number of playlists to process in parallel worker processes '
+             f'(default: {PlaylistDownloader.DEFAULT_PLAYLIST_CONCURRENCY})'
+    )
+
+    parser.add_argument(
+        '--listing-ttl',
+        type=int,
+        default=PlaylistDownloader.DEFAULT_LISTING_TTL,
+        metavar='SECONDS',
+        help='How long cached playlist listings are reused, 0 to disable '
+             f'(default: {PlaylistDownloader.DEFAULT_LISTING_TTL})'
+    )
+
     args = parser.parse_args()
 
     # Initialize and run downloader
-    downloader = PlaylistDownloader(args.channel, args.output_dir)
+    downloader = PlaylistDownloader(args.channel, args.output_dir, concurrency=args.concurrency,
+                                    listing_ttl=args.listing_ttl,
+                                    playlist_concurrency=args.playlist_concurrency)
     downloader.run()
 
 